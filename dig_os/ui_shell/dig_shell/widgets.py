@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 
 from datetime import datetime
+import asyncio
 import importlib.util
 import time
 import socket
@@ -771,6 +772,7 @@ class BrowserDialog(QDialog):
         root.addWidget(self.status)
 
         self._current_url = "https://www.google.com"
+        self._current_qurl: QUrl | None = None
         self.web: QWebEngineView | None = None
         self.fallback_text: QLabel | None = None
 
@@ -801,6 +803,7 @@ class BrowserDialog(QDialog):
 
     def open_url(self, url: str) -> None:
         target = QUrl.fromUserInput(url)
+        self._current_qurl = target
         self._current_url = target.toString()
         self.url_input.setText(self._current_url)
         if self.web is not None:
@@ -812,6 +815,12 @@ class BrowserDialog(QDialog):
     def _go_to_input(self) -> None:
         self.open_url(self.url_input.text().strip())
 
+    def _input_qurl(self) -> QUrl:
+        text = self.url_input.text().strip()
+        if self._current_qurl is not None and text == self._current_url:
+            return self._current_qurl
+        return QUrl.fromUserInput(text)
+
     def _go_back(self) -> None:
         if self.web is not None:
             self.web.back()
@@ -824,10 +833,10 @@ class BrowserDialog(QDialog):
         if self.web is not None:
             self.web.reload()
             return
-        self._open_external_url(QUrl.fromUserInput(self.url_input.text().strip()))
+        self._open_external_url(self._input_qurl())
 
     def _open_external(self) -> None:
-        self._open_external_url(QUrl.fromUserInput(self.url_input.text().strip()))
+        self._open_external_url(self._input_qurl())
 
     def _open_external_url(self, target: QUrl) -> None:
         ok = QDesktopServices.openUrl(target)
@@ -841,7 +850,7 @@ class BrowserDialog(QDialog):
             self.status.setText("Loaded")
             return
         self.status.setText("Embedded load failed. Opening in system browser...")
-        self._open_external_url(QUrl.fromUserInput(self.url_input.text().strip()))
+        self._open_external_url(self._input_qurl())
 
 
 class JupyterServerManager:
@@ -917,14 +926,24 @@ class JupyterServerManager:
 
     @staticmethod
     def _wait_for_port(port: int, timeout: float) -> bool:
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(0.2)
-                if sock.connect_ex(("127.0.0.1", port)) == 0:
-                    return True
-            time.sleep(0.2)
-        return False
+        async def _probe() -> None:
+            delay = 0.05
+            while True:
+                try:
+                    _, writer = await asyncio.open_connection("127.0.0.1", port)
+                except (ConnectionRefusedError, OSError):
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 1.0)
+                else:
+                    writer.close()
+                    await writer.wait_closed()
+                    return
+
+        try:
+            asyncio.run(asyncio.wait_for(_probe(), timeout))
+        except (asyncio.TimeoutError, OSError):
+            return False
+        return True
 
 
 class JupyterNotebookDialog(BrowserDialog):
@@ -975,84 +994,70 @@ class SettingsPanel(QFrame):
         self.tabs = QTabWidget()
         root.addWidget(self.tabs, 1)
 
-        self.tabs.addTab(self._system_tab(), "System")
-        self.tabs.addTab(self._mining_tab(), "Mining")
-        self.tabs.addTab(self._gpu_tab(), "GPU")
-        self.tabs.addTab(self._network_tab(), "Network")
-        self.tabs.addTab(self._security_tab(), "Security")
-        self.tabs.addTab(self._wallet_tab(), "Wallet")
-        self.tabs.addTab(self._updates_tab(), "Updates")
-        self.tabs.addTab(self._advanced_tab(), "Advanced")
-
-    def _system_tab(self) -> QWidget:
+        for name, spec in self._TAB_SPECS.items():
+            self.tabs.addTab(self._build_tab(spec), name)
+
+    _TAB_SPECS = {
+        "System": (
+            ("Performance profile", lambda panel: panel._combo(("Balanced", "Performance Lock", "Eco"))),
+            ("Theme", lambda panel: panel._combo(("Nordic Dark", "Adwaita Dark", "Opportunity Dark"))),
+            ("Workspace behavior", lambda panel: panel._combo(("Static workspaces", "Dynamic workspaces"))),
+        ),
+        "Mining": (
+            ("Default pool", lambda panel: QLineEdit("stratum+tcp://pool.dig.net:4444")),
+            ("Backup pool", lambda panel: QLineEdit("stratum+tcp://backup.dig.net:4444")),
+            ("Coin selection", lambda panel: panel._combo(("ALGO", "ERG", "RVN", "AUTO"))),
+            ("Auto-profit mode", lambda panel: QCheckBox("Enable dynamic coin switching")),
+            ("Benchmark", lambda panel: panel._benchmark_button()),
+        ),
+        "GPU": (
+            ("Core clock offset", lambda panel: panel._slider(-300, 300, 80)),
+            ("Memory clock offset", lambda panel: panel._slider(-1000, 1500, 320)),
+            ("Power limit (%)", lambda panel: panel._slider(40, 120, 85)),
+            ("Fan target (%)", lambda panel: panel._slider(20, 100, 62)),
+        ),
+        "Network": (
+            ("Primary interface", lambda panel: panel._combo(("eth0", "wlan0", "auto"))),
+            ("Failover", lambda panel: QCheckBox("Enable backup route")),
+            ("Cluster API", lambda panel: QLineEdit("https://cluster.dig.net/api")),
+        ),
+        "Security": (
+            ("Wallet encryption", lambda panel: QCheckBox("TPM-backed vault enabled")),
+            ("SSH", lambda panel: QCheckBox("Allow hardened SSH")),
+            ("Firewall", lambda panel: QCheckBox("Enable nftables ruleset")),
+            ("Secure boot status", lambda panel: QLabel("Verified")),
+        ),
+        "Wallet": (
+            ("Wallet address", lambda panel: QLineEdit("dig1q9x8...m4k2")),
+            ("Auto-payout threshold", lambda panel: QLineEdit("250 ALGO")),
+            ("2FA withdrawals", lambda panel: QCheckBox("Require OTP")),
+        ),
+        "Updates": (
+            ("Channel", lambda panel: panel._combo(("Stable", "LTS", "Testing"))),
+            ("Btrfs snapshots", lambda panel: QCheckBox("Create pre-update snapshot")),
+            ("Auto rollback", lambda panel: QCheckBox("Rollback on failed boot")),
+        ),
+        "Advanced": (
+            ("cgroups v2 UI reservation", lambda panel: QLineEdit("CPU 5% | GPU 5%")),
+            ("Thermal throttle", lambda panel: QLineEdit("85C => reduce workload by 20%")),
+            ("Cluster mode", lambda panel: QCheckBox("Enable remote node manager")),
+        ),
+    }
+
+    def _build_tab(self, spec: tuple[tuple[str, object], ...]) -> QWidget:
         page = QWidget()
         form = QFormLayout(page)
-        form.addRow("Performance profile", self._combo(("Balanced", "Performance Lock", "Eco")))
-        form.addRow("Theme", self._combo(("Nordic Dark", "Adwaita Dark", "Opportunity Dark")))
-        form.addRow("Workspace behavior", self._combo(("Static workspaces", "Dynamic workspaces")))
+        for label, factory in spec:
+            form.addRow(label, factory(self))
         return page
 
-    def _mining_tab(self) -> QWidget:
-        page = QWidget()
-        form = QFormLayout(page)
-        form.addRow("Default pool", QLineEdit("stratum+tcp://pool.dig.net:4444"))
-        form.addRow("Backup pool", QLineEdit("stratum+tcp://backup.dig.net:4444"))
-        form.addRow("Coin selection", self._combo(("ALGO", "ERG", "RVN", "AUTO")))
-        form.addRow("Auto-profit mode", QCheckBox("Enable dynamic coin switching"))
+    def _benchmark_button(self) -> QPushButton:
         benchmark = QPushButton("Run benchmark")
-        benchmark.clicked.connect(lambda: self.mode_requested.emit("gaming"))
-        form.addRow("Benchmark", benchmark)
-        return page
-
-    def _gpu_tab(self) -> QWidget:
-        page = QWidget()
-        form = QFormLayout(page)
-        form.addRow("Core clock offset", self._slider(-300, 300, 80))
-        form.addRow("Memory clock offset", self._slider(-1000, 1500, 320))
-        form.addRow("Power limit (%)", self._slider(40, 120, 85))
-        form.addRow("Fan target (%)", self._slider(20, 100, 62))
-        return page
-
-    def _network_tab(self) -> QWidget:
-        page = QWidget()
-        form = QFormLayout(page)
-        form.addRow("Primary interface", self._combo(("eth0", "wlan0", "auto")))
-        form.addRow("Failover", QCheckBox("Enable backup route"))
-        form.addRow("Cluster API", QLineEdit("https://cluster.dig.net/api"))
-        return page
-
-    def _security_tab(self) -> QWidget:
-        page = QWidget()
-        form = QFormLayout(page)
-        form.addRow("Wallet encryption", QCheckBox("TPM-backed vault enabled"))
-        form.addRow("SSH", QCheckBox("Allow hardened SSH"))
-        form.addRow("Firewall", QCheckBox("Enable nftables ruleset"))
-        form.addRow("Secure boot status", QLabel("Verified"))
-        return page
-
-    def _wallet_tab(self) -> QWidget:
-        page = QWidget()
-        form = QFormLayout(page)
-        form.addRow("Wallet address", QLineEdit("dig1q9x8...m4k2"))
-        form.addRow("Auto-payout threshold", QLineEdit("250 ALGO"))
-        form.addRow("2FA withdrawals", QCheckBox("Require OTP"))
-        return page
-
-    def _updates_tab(self) -> QWidget:
-        page = QWidget()
-        form = QFormLayout(page)
-        form.addRow("Channel", self._combo(("Stable", "LTS", "Testing")))
-        form.addRow("Btrfs snapshots", QCheckBox("Create pre-update snapshot"))
-        form.addRow("Auto rollback", QCheckBox("Rollback on failed boot"))
-        return page
+        benchmark.clicked.connect(self._emit_gaming)
+        return benchmark
 
-    def _advanced_tab(self) -> QWidget:
-        page = QWidget()
-        form = QFormLayout(page)
-        form.addRow("cgroups v2 UI reservation", QLineEdit("CPU 5% | GPU 5%"))
-        form.addRow("Thermal throttle", QLineEdit("85C => reduce workload by 20%"))
-        form.addRow("Cluster mode", QCheckBox("Enable remote node manager"))
-        return page
+    def _emit_gaming(self) -> None:
+        self.mode_requested.emit("gaming")
 
     @staticmethod
     def _combo(values: tuple[str, ...]) -> QComboBox:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+import time
 
 from PySide6.QtCore import QThread, Signal
 
@@ -29,17 +29,18 @@ class WalletSyncThread(QThread):
             self.address_loaded.emit(self.wallet.address)
 
         while not self.isInterruptionRequested():
+            ts = time.strftime("%H:%M:%S")
             try:
                 live_balance = self.wallet.get_balance()
                 if self.wallet.last_error:
                     self.sync_error.emit(f"Algorand balance sync failed: {self.wallet.last_error}")
-                    self.sync_tick.emit(False, datetime.now().strftime("%H:%M:%S"))
+                    self.sync_tick.emit(False, ts)
                 else:
                     self.balance_updated.emit(live_balance)
-                    self.sync_tick.emit(True, datetime.now().strftime("%H:%M:%S"))
+                    self.sync_tick.emit(True, ts)
             except Exception as exc:
                 self.sync_error.emit(f"Algorand balance sync failed: {exc}")
-                self.sync_tick.emit(False, datetime.now().strftime("%H:%M:%S"))
+                self.sync_tick.emit(False, ts)
 
             for _ in range(self.poll_interval_sec * 10):
                 if self.isInterruptionRequested():
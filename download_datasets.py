@@ -4,22 +4,33 @@ Run this script once before launching the demo.
 """
 import os
 
+def _write_csv(df, path, sep=",", header=True):
+    """Write a DataFrame as CSV via PyArrow's C++ writer (falls back to pandas)."""
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        df.to_csv(path, sep=sep, index=False, header=header)
+        return
+    options = pacsv.WriteOptions(include_header=header, delimiter=sep)
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path, options)
+
 def download_datasets():
     os.makedirs("datasets", exist_ok=True)
-    
+
     print("Downloading datasets using scikit-learn...")
-    
+
     # 1. Cancer Dataset
     from sklearn.datasets import load_breast_cancer
     import pandas as pd
-    
+
     cancer = load_breast_cancer()
     df_cancer = pd.DataFrame(cancer.data, columns=cancer.feature_names)
     df_cancer['diagnosis'] = ['M' if t == 0 else 'B' for t in cancer.target]
     df_cancer.insert(0, 'id', range(1, len(df_cancer) + 1))
-    df_cancer.to_csv("datasets/cancer.csv", index=False)
+    _write_csv(df_cancer, "datasets/cancer.csv")
     print(f"  [OK] datasets/cancer.csv ({len(df_cancer)} rows)")
-    
+
     # 2. Wine Dataset
     from sklearn.datasets import load_wine
     wine = load_wine()
@@ -27,17 +38,18 @@ def download_datasets():
     # Create a 'quality' column (scale 1-10) from the target classes
     import numpy as np
     df_wine['quality'] = np.where(wine.target == 0, 4, np.where(wine.target == 1, 6, 8))
-    df_wine.to_csv("datasets/wine.csv", sep=";", index=False)
+    _write_csv(df_wine, "datasets/wine.csv", sep=";")
     print(f"  [OK] datasets/wine.csv ({len(df_wine)} rows)")
-    
+
     # 3. Digits Dataset
     from sklearn.datasets import load_digits
     digits = load_digits()
     df_digits = pd.DataFrame(digits.data)
     df_digits[len(digits.data[0])] = digits.target  # Last column is label
-    df_digits.to_csv("datasets/digits.csv", index=False, header=False)
+    df_digits.columns = [str(c) for c in df_digits.columns]  # Arrow requires string column names
+    _write_csv(df_digits, "datasets/digits.csv", header=False)
     print(f"  [OK] datasets/digits.csv ({len(df_digits)} rows)")
-    
+
     print("\nAll datasets downloaded successfully!")
     print("You can now run: python neurochain_demo.py")
 
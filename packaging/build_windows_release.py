@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import concurrent.futures
 import json
+import os
 from pathlib import Path
 import shutil
 import subprocess
@@ -20,8 +22,12 @@ def _run(command: list[str]) -> None:
     subprocess.run(command, cwd=str(ROOT), check=True)
 
 
-def _run_pyinstaller(args: list[str]) -> None:
-    _run([sys.executable, "-m", "PyInstaller", "--noconfirm", "--clean", *args])
+def _run_pyinstaller(args: list[str], clean: bool = False) -> None:
+    # --clean wipes PyInstaller's shared global cache, so it must only run
+    # from a serial invocation -- the parallel app builds would race on
+    # deleting and repopulating the same directory.
+    flags = ["--noconfirm", "--clean"] if clean else ["--noconfirm"]
+    _run([sys.executable, "-m", "PyInstaller", *flags, *args])
 
 
 def _copy_required_assets() -> None:
@@ -70,14 +76,45 @@ def _copy_required_assets() -> None:
         )
 
 
+# Deflating data that is already compressed just burns CPU for ~0% gain.
+_STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".ttf", ".otf", ".zip", ".7z"}
+
+
+def _iter_payload_files(directory: str):
+    """scandir recursion: DirEntry caches type/stat info, so the walk does
+    one batched syscall per directory instead of a stat per Path."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_payload_files(entry.path)
+            else:
+                yield entry
+
+
 def _zip_payload() -> None:
     if PAYLOAD_ZIP.exists():
         PAYLOAD_ZIP.unlink()
-    with zipfile.ZipFile(PAYLOAD_ZIP, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for path in PAYLOAD_DIR.rglob("*"):
-            if path.is_dir():
-                continue
-            archive.write(path, path.relative_to(PAYLOAD_DIR))
+    files = sorted(
+        _iter_payload_files(str(PAYLOAD_DIR)),
+        key=lambda entry: entry.stat().st_size,
+        reverse=True,
+    )
+    payload_root = str(PAYLOAD_DIR)
+    with zipfile.ZipFile(
+        PAYLOAD_ZIP, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+    ) as archive:
+        for entry in files:
+            suffix = os.path.splitext(entry.name)[1].lower()
+            compress_type = (
+                zipfile.ZIP_STORED
+                if suffix in _STORED_SUFFIXES
+                else zipfile.ZIP_DEFLATED
+            )
+            archive.write(
+                entry.path,
+                os.path.relpath(entry.path, payload_root),
+                compress_type=compress_type,
+            )
 
 
 def _prepare_release_dir() -> None:
@@ -89,7 +126,7 @@ def _prepare_release_dir() -> None:
 def build_all() -> None:
     _prepare_release_dir()
 
-    _run_pyinstaller(
+    app_builds = [
         [
             "--onefile",
             "--windowed",
@@ -106,9 +143,7 @@ def build_all() -> None:
             "--exclude-module",
             "PyQt6",
             str(ROOT / "dig_os" / "ui_shell" / "main.py"),
-        ]
-    )
-    _run_pyinstaller(
+        ],
         [
             "--onefile",
             "--windowed",
@@ -119,9 +154,7 @@ def build_all() -> None:
             "--exclude-module",
             "PySide6",
             str(ROOT / "neurochain_demo.py"),
-        ]
-    )
-    _run_pyinstaller(
+        ],
         [
             "--onefile",
             "--windowed",
@@ -138,8 +171,16 @@ def build_all() -> None:
             "--exclude-module",
             "PySide6",
             str(ROOT / "qubofinalprotype" / "qubofinalprotype" / "qubofinalprotype" / "run_gui.py"),
-        ]
-    )
+        ],
+    ]
+
+    # The three app builds are independent (each works under its own
+    # build/<name> directory), so run them concurrently; subprocess.run
+    # releases the GIL while each PyInstaller process works.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(app_builds)) as pool:
+        futures = [pool.submit(_run_pyinstaller, args) for args in app_builds]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
 
     _copy_required_assets()
     _zip_payload()
@@ -152,7 +193,8 @@ def build_all() -> None:
             "--add-data",
             f"{PAYLOAD_ZIP};.",
             str(ROOT / "packaging" / "windows_installer.py"),
-        ]
+        ],
+        clean=True,
     )
 
     setup_exe = DIST_DIR / "NuroChainSetup.exe"
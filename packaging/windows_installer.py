@@ -1,20 +1,29 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+from collections.abc import Iterator
+import ctypes
+import functools
 import json
+import mmap
 import os
 from pathlib import Path
 import shutil
 import subprocess
 import sys
-import tempfile
+import threading
 import zipfile
 
 APP_NAME = "NuroChain Opportunity OS"
 PAYLOAD_FILE = "nurochain_payload.zip"
 SHORTCUT_FOLDER_NAME = "NuroChain Opportunity OS"
 
+# Resolved once: Path.resolve() stats every component of the chain.
+_MODULE_PATH = Path(__file__).resolve()
 
+
+@functools.lru_cache(maxsize=1)
 def _default_install_dir() -> Path:
     local_app_data = os.environ.get("LOCALAPPDATA")
     if local_app_data:
@@ -22,6 +31,7 @@ def _default_install_dir() -> Path:
     return Path.home() / "NuroChain"
 
 
+@functools.lru_cache(maxsize=1)
 def _default_desktop_dir() -> Path:
     user_profile = os.environ.get("USERPROFILE")
     if user_profile:
@@ -29,6 +39,7 @@ def _default_desktop_dir() -> Path:
     return Path.home() / "Desktop"
 
 
+@functools.lru_cache(maxsize=1)
 def _default_start_menu_programs_dir() -> Path:
     appdata = os.environ.get("APPDATA")
     if appdata:
@@ -36,33 +47,28 @@ def _default_start_menu_programs_dir() -> Path:
     return Path.home() / "AppData" / "Roaming" / "Microsoft" / "Windows" / "Start Menu" / "Programs"
 
 
-def _payload_candidates() -> list[Path]:
-    candidates: list[Path] = []
+def _payload_candidates() -> Iterator[Path]:
+    # Lazy: Path.resolve() stats every path component, and the first
+    # candidate usually wins, so later ones should never be built.
     if getattr(sys, "frozen", False):
         meipass = getattr(sys, "_MEIPASS", None)
         if meipass:
-            candidates.append(Path(meipass) / PAYLOAD_FILE)
-        candidates.append(Path(sys.executable).resolve().parent / PAYLOAD_FILE)
-    candidates.append(Path(__file__).resolve().with_name(PAYLOAD_FILE))
-    return candidates
+            yield Path(meipass) / PAYLOAD_FILE
+        yield Path(sys.executable).resolve().parent / PAYLOAD_FILE
+    yield _MODULE_PATH.with_name(PAYLOAD_FILE)
 
 
 def _resolve_payload_path() -> Path:
+    searched: list[Path] = []
     for candidate in _payload_candidates():
         if candidate.exists():
             return candidate
-    searched = "\n".join(str(path) for path in _payload_candidates())
-    raise FileNotFoundError(f"Unable to locate installer payload.\nChecked:\n{searched}")
+        searched.append(candidate)
+    checked = "\n".join(str(path) for path in searched)
+    raise FileNotFoundError(f"Unable to locate installer payload.\nChecked:\n{checked}")
 
 
-def _copy_tree_contents(source: Path, destination: Path) -> None:
-    for item in source.iterdir():
-        target = destination / item.name
-        if item.is_dir():
-            shutil.copytree(item, target, dirs_exist_ok=True)
-            continue
-        target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(item, target)
+_COPY_CHUNK = 1024 * 1024
 
 
 def _ensure_runtime_defaults(install_dir: Path) -> None:
@@ -101,17 +107,118 @@ def _ps_quote(value: str) -> str:
     return "'" + value.replace("'", "''") + "'"
 
 
-def _create_windows_shortcut(link_path: Path, target_path: Path, working_dir: Path) -> bool:
-    icon_value = f"{target_path},0"
+class _GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", ctypes.c_uint32),
+        ("Data2", ctypes.c_uint16),
+        ("Data3", ctypes.c_uint16),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+
+def _com_call(interface: "ctypes.c_void_p", index: int, *args):
+    """Invoke vtable slot `index` on a raw COM interface pointer.
+
+    Declared with HRESULT restype so failing calls raise OSError.
+    """
+    vtable = ctypes.cast(
+        ctypes.cast(interface, ctypes.POINTER(ctypes.c_void_p)).contents.value,
+        ctypes.POINTER(ctypes.c_void_p),
+    )
+    prototype = ctypes.WINFUNCTYPE(
+        ctypes.HRESULT, ctypes.c_void_p, *(ctypes.c_void_p,) * len(args)
+    )
+    return prototype(vtable[index])(interface, *args)
+
+
+def _create_lnk_via_com(link_path: Path, target_path: Path, working_dir: Path) -> bool:
+    """Write a .lnk in-process via IShellLinkW instead of spawning PowerShell.
+
+    Vtable slots: IShellLinkW -- 0 QueryInterface, 2 Release,
+    9 SetWorkingDirectory, 17 SetIconLocation, 20 SetPath;
+    IPersistFile -- 6 Save.
+    """
+    if not sys.platform.startswith("win"):
+        return False
+    try:
+        ole32 = ctypes.OleDLL("ole32")
+        try:
+            ole32.CoInitializeEx(None, 2)  # COINIT_APARTMENTTHREADED
+        except OSError:
+            pass  # already initialized in an incompatible mode; try anyway
+        clsid_shell_link = _GUID()
+        iid_shell_link = _GUID()
+        iid_persist_file = _GUID()
+        ole32.CLSIDFromString(
+            "{00021401-0000-0000-C000-000000000046}", ctypes.byref(clsid_shell_link)
+        )
+        ole32.IIDFromString(
+            "{000214F9-0000-0000-C000-000000000046}", ctypes.byref(iid_shell_link)
+        )
+        ole32.IIDFromString(
+            "{0000010B-0000-0000-C000-000000000046}", ctypes.byref(iid_persist_file)
+        )
+        shell_link = ctypes.c_void_p()
+        ole32.CoCreateInstance(
+            ctypes.byref(clsid_shell_link),
+            None,
+            1,  # CLSCTX_INPROC_SERVER
+            ctypes.byref(iid_shell_link),
+            ctypes.byref(shell_link),
+        )
+        try:
+            _com_call(shell_link, 20, ctypes.c_wchar_p(str(target_path)))
+            _com_call(shell_link, 9, ctypes.c_wchar_p(str(working_dir)))
+            _com_call(shell_link, 17, ctypes.c_wchar_p(str(target_path)), 0)
+            persist_file = ctypes.c_void_p()
+            _com_call(
+                shell_link,
+                0,
+                ctypes.byref(iid_persist_file),
+                ctypes.byref(persist_file),
+            )
+            try:
+                _com_call(persist_file, 6, ctypes.c_wchar_p(str(link_path)), 1)
+            finally:
+                _com_call(persist_file, 2)
+        finally:
+            _com_call(shell_link, 2)
+        return link_path.exists()
+    except Exception:
+        return False
+
+
+def _create_windows_shortcuts(
+    entries: list[tuple[Path, Path, Path]],
+) -> set[Path]:
+    """Create every .lnk in one PowerShell invocation.
+
+    PowerShell cold start dwarfs the COM calls themselves, so one spawn for
+    all shortcuts beats one spawn per shortcut. Returns the links that exist
+    afterwards; the caller falls back per-shortcut for any that are missing.
+    """
+    if not entries:
+        return set()
+    blocks = []
+    for link_path, target_path, working_dir in entries:
+        blocks.append(
+            f"$shortcut=$shell.CreateShortcut({_ps_quote(str(link_path))});"
+            f"$shortcut.TargetPath={_ps_quote(str(target_path))};"
+            f"$shortcut.WorkingDirectory={_ps_quote(str(working_dir))};"
+            f"$shortcut.IconLocation={_ps_quote(f'{target_path},0')};"
+            "$shortcut.Save();"
+        )
     script = (
-        "$ErrorActionPreference='Stop';"
-        "$shell=New-Object -ComObject WScript.Shell;"
-        f"$shortcut=$shell.CreateShortcut({_ps_quote(str(link_path))});"
-        f"$shortcut.TargetPath={_ps_quote(str(target_path))};"
-        f"$shortcut.WorkingDirectory={_ps_quote(str(working_dir))};"
-        f"$shortcut.IconLocation={_ps_quote(icon_value)};"
-        "$shortcut.Save();"
+        "$ErrorActionPreference='Continue';"
+        "$shell=New-Object -ComObject WScript.Shell;" + "".join(blocks)
     )
+    # Same flags as _launch_app: skip conhost attachment and the serialized
+    # console-teardown path that Windows 10 takes for windowed children.
+    creationflags = 0
+    if sys.platform.startswith("win"):
+        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0) | getattr(
+            subprocess, "DETACHED_PROCESS", 0
+        )
     for shell_executable in ("powershell", "pwsh"):
         try:
             subprocess.run(
@@ -126,11 +233,12 @@ def _create_windows_shortcut(link_path: Path, target_path: Path, working_dir: Pa
                 check=True,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                creationflags=creationflags,
             )
-            return True
+            break
         except Exception:
             continue
-    return False
+    return {link for link, _target, _workdir in entries if link.exists()}
 
 
 def _write_batch_shortcut(path: Path, target_path: Path, working_dir: Path) -> None:
@@ -148,7 +256,6 @@ def _create_shortcuts(
     desktop_dir: Path | None = None,
     start_menu_dir: Path | None = None,
 ) -> list[Path]:
-    created: list[Path] = []
     desktop_root = (desktop_dir or _default_desktop_dir()).resolve()
     start_menu_root = (start_menu_dir or _default_start_menu_programs_dir()).resolve()
     start_menu_folder = start_menu_root / SHORTCUT_FOLDER_NAME
@@ -160,37 +267,103 @@ def _create_shortcuts(
     )
 
     desktop_root.mkdir(parents=True, exist_ok=True)
+    start_menu_folder.mkdir(parents=True, exist_ok=True)
+
+    wanted: list[tuple[Path, Path, Path]] = []
     main_target = install_dir / "OpportunityOS.exe"
     if main_target.exists():
         desktop_link = desktop_root / f"{SHORTCUT_FOLDER_NAME}.lnk"
-        if _create_windows_shortcut(desktop_link, main_target, install_dir):
-            created.append(desktop_link)
-        else:
-            desktop_bat = desktop_root / f"{SHORTCUT_FOLDER_NAME}.bat"
-            _write_batch_shortcut(desktop_bat, main_target, install_dir)
-            created.append(desktop_bat)
-
-    start_menu_folder.mkdir(parents=True, exist_ok=True)
+        wanted.append((desktop_link, main_target, install_dir))
     for label, target in app_entries:
-        if not target.exists():
-            continue
-        link_path = start_menu_folder / f"{label}.lnk"
-        if _create_windows_shortcut(link_path, target, install_dir):
+        if target.exists():
+            wanted.append((start_menu_folder / f"{label}.lnk", target, install_dir))
+
+    # Direct COM first (four method calls, no process spawn); anything it
+    # could not write falls back to the batched PowerShell path.
+    created_links = {
+        link for link, target, workdir in wanted
+        if _create_lnk_via_com(link, target, workdir)
+    }
+    remaining = [entry for entry in wanted if entry[0] not in created_links]
+    created_links |= _create_windows_shortcuts(remaining)
+    created: list[Path] = []
+    for link_path, target, working_dir in wanted:
+        if link_path in created_links:
             created.append(link_path)
             continue
-        bat_path = start_menu_folder / f"{label}.bat"
-        _write_batch_shortcut(bat_path, target, install_dir)
+        bat_path = link_path.with_suffix(".bat")
+        _write_batch_shortcut(bat_path, target, working_dir)
         created.append(bat_path)
     return created
 
 
+def _open_payload_archive(payload_zip: Path) -> tuple[zipfile.ZipFile, tuple]:
+    """Open a payload reader backed by an mmap of the archive when possible.
+
+    zlib then inflates straight off the page cache and the kernel can read
+    ahead over the whole file. Returns the ZipFile plus the underlying
+    handles, which the caller must close (ZipFile does not own them).
+    """
+    fh = open(payload_zip, "rb")
+    try:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return zipfile.ZipFile(fh), (fh,)
+    return zipfile.ZipFile(mm), (mm, fh)
+
+
+def _extract_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path) -> None:
+    with archive.open(info) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, _COPY_CHUNK)
+
+
 def install(payload_zip: Path, install_dir: Path) -> None:
+    # Stream entries straight into install_dir: extracting to a temp dir and
+    # copying over afterwards writes every payload byte to disk twice.
     install_dir.mkdir(parents=True, exist_ok=True)
-    with tempfile.TemporaryDirectory(prefix="nurochain_setup_") as temp_dir:
-        temp_root = Path(temp_dir)
-        with zipfile.ZipFile(payload_zip, "r") as archive:
-            archive.extractall(temp_root)
-        _copy_tree_contents(temp_root, install_dir)
+    install_root = str(install_dir.resolve())
+    members: list[tuple[zipfile.ZipInfo, Path]] = []
+    with zipfile.ZipFile(payload_zip, "r") as archive:
+        for info in archive.infolist():
+            target = (install_dir / info.filename).resolve()
+            if os.path.commonpath([install_root, str(target)]) != install_root:
+                raise ValueError(f"Unsafe payload entry: {info.filename}")
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            members.append((info, target))
+
+    # zlib releases the GIL while inflating, so DEFLATE genuinely runs in
+    # parallel across threads instead of pinning one core. Each worker lazily
+    # opens one archive handle and reuses it for every entry it extracts --
+    # readers cannot share a handle (they would seek against each other), but
+    # one handle per entry would pay open/central-directory parsing N times.
+    if members:
+        local = threading.local()
+        opened: list[tuple[zipfile.ZipFile, tuple]] = []
+        opened_lock = threading.Lock()
+
+        def extract(info: zipfile.ZipInfo, target: Path) -> None:
+            archive = getattr(local, "archive", None)
+            if archive is None:
+                archive, handles = _open_payload_archive(payload_zip)
+                local.archive = archive
+                with opened_lock:
+                    opened.append((archive, handles))
+            _extract_member(archive, info, target)
+
+        max_workers = min(32, os.cpu_count() or 1, len(members))
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(extract, info, target) for info, target in members]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+        finally:
+            for archive, handles in opened:
+                archive.close()
+                for handle in handles:
+                    handle.close()
 
     _ensure_runtime_defaults(install_dir)
     _write_launcher(install_dir)
@@ -200,6 +373,20 @@ def _launch_app(install_dir: Path) -> None:
     executable = install_dir / "OpportunityOS.exe"
     if not executable.exists():
         return
+    if sys.platform.startswith("win"):
+        # ShellExecute launches through the shell with no intermediate
+        # child-process host, which is cheaper than CreateProcess via Popen.
+        try:
+            os.startfile(str(executable), cwd=str(install_dir))  # type: ignore[call-arg]
+            return
+        except TypeError:
+            # The cwd keyword needs Python 3.10+; call ShellExecuteW directly.
+            if ctypes.windll.shell32.ShellExecuteW(
+                None, "open", str(executable), None, str(install_dir), 1
+            ) > 32:
+                return
+        except OSError:
+            pass
     kwargs: dict[str, object] = {"cwd": str(install_dir)}
     if sys.platform.startswith("win"):
         kwargs["creationflags"] = (
@@ -8,13 +8,23 @@ Provides endpoints for:
 """
 from __future__ import annotations
 
+import base64
+import concurrent.futures
+import itertools
 import json
+import os
 import traceback
+from collections import Counter, OrderedDict
 from typing import Dict, List, Any, Optional
 from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 from .circuit import QuantumCircuit
 from .simulator import StatevectorSimulator
 from .visualizer import CircuitVisualizer
@@ -23,9 +33,90 @@ from . import noise as noise_mod
 app = Flask(__name__)
 CORS(app)  # Enable CORS for web frontend integration
 
+def _json(payload, status: int = 200) -> Response:
+    """jsonify stand-in backed by orjson when it is installed.
+
+    orjson serializes numpy scalars/arrays natively at C speed; without it
+    we fall back to Flask's stdlib encoder.
+    """
+    if orjson is not None:
+        return Response(
+            orjson.dumps(
+                payload,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            ),
+            status=status,
+            mimetype='application/json',
+        )
+    response = jsonify(payload)
+    response.status_code = status
+    return response
+
+
+class _LRUDict(OrderedDict):
+    """Minimal LRU mapping: lookups refresh recency, inserts evict the oldest.
+
+    A stored statevector is 16 * 2^n bytes (16 MiB at n=20), so unbounded
+    per-process dicts grow until the server OOMs.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 # Global storage for circuits (in production, use proper database)
-circuits: Dict[str, QuantumCircuit] = {}
-simulation_results: Dict[str, Any] = {}
+circuits: Dict[str, QuantumCircuit] = _LRUDict(maxsize=256)
+simulation_results: Dict[str, Any] = _LRUDict(maxsize=64)
+_result_seq = itertools.count()
+
+# Process pool for batch simulation, created lazily so importing the API
+# module (CLI, tests) never forks workers.
+_SIM_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _sim_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _SIM_POOL
+    if _SIM_POOL is None:
+        _SIM_POOL = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _SIM_POOL
+
+
+# Background executor for async single simulations. Threads, not
+# processes: the noise hook is a per-request closure and does not pickle.
+_SIM_EXEC: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_sim_jobs: Dict[str, Any] = _LRUDict(maxsize=128)
+
+
+def _sim_exec() -> concurrent.futures.ThreadPoolExecutor:
+    global _SIM_EXEC
+    if _SIM_EXEC is None:
+        _SIM_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _SIM_EXEC
+
+
+def _run_one(num_qubits: int, gate_spec: List[tuple], sim_config: Dict[str, Any]):
+    """Pool worker: rebuild the circuit from its gate tuples and run one sim.
+
+    Circuits cross the process boundary as (name, targets, params) tuples,
+    which pickle in microseconds; statevectors/counts pickle back as-is.
+    """
+    circuit = QuantumCircuit(num_qubits)
+    for name, targets, params in gate_spec:
+        circuit.add_gate(name, targets=list(targets), params=list(params))
+    simulator = StatevectorSimulator(circuit)
+    return simulator.run(shots=sim_config.get('shots', 1024))
 
 # ============ CIRCUIT BUILDER API ============
 
@@ -47,29 +138,29 @@ def create_circuit():
         description = data.get('description', '')
         
         if name in circuits:
-            return jsonify({'error': f'Circuit {name} already exists'}), 400
+            return _json({'error': f'Circuit {name} already exists'}, 400)
             
         circuit = QuantumCircuit(num_qubits)
         circuit.description = description
         circuits[name] = circuit
         
-        return jsonify({
+        return _json({
             'success': True,
             'circuit_id': name,
             'num_qubits': num_qubits,
             'description': description
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return _json({'error': str(e)}, 500)
 
 @app.route('/api/v1/circuit/<circuit_id>', methods=['GET'])
 def get_circuit(circuit_id: str):
     """Get circuit information."""
     if circuit_id not in circuits:
-        return jsonify({'error': 'Circuit not found'}), 404
+        return _json({'error': 'Circuit not found'}, 404)
     
     circuit = circuits[circuit_id]
-    return jsonify({
+    return _json({
         'circuit_id': circuit_id,
         'num_qubits': circuit.num_qubits,
         'gates': [str(gate) for gate in circuit.gates],
@@ -91,7 +182,7 @@ def add_gate(circuit_id: str):
     """
     try:
         if circuit_id not in circuits:
-            return jsonify({'error': 'Circuit not found'}), 404
+            return _json({'error': 'Circuit not found'}, 404)
             
         data = request.get_json()
         gate_type = data['gate_type']
@@ -106,7 +197,7 @@ def add_gate(circuit_id: str):
         else:
             circuit.add_gate(gate_type, targets=targets, params=params)
             
-        return jsonify({
+        return _json({
             'success': True,
             'gate_added': {
                 'type': gate_type,
@@ -117,17 +208,17 @@ def add_gate(circuit_id: str):
             'circuit_depth': len(circuit.gates)
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return _json({'error': str(e)}, 500)
 
 @app.route('/api/v1/circuit/<circuit_id>/gates', methods=['DELETE'])
 def clear_circuit(circuit_id: str):
     """Clear all gates from circuit."""
     if circuit_id not in circuits:
-        return jsonify({'error': 'Circuit not found'}), 404
+        return _json({'error': 'Circuit not found'}, 404)
     
     circuit = circuits[circuit_id]
-    circuit.gates.clear()
-    return jsonify({'success': True, 'message': 'Circuit cleared'})
+    circuit.clear()
+    return _json({'success': True, 'message': 'Circuit cleared'})
 
 @app.route('/api/v1/circuits', methods=['GET'])
 def list_circuits():
@@ -140,7 +231,7 @@ def list_circuits():
             'depth': len(circuit.gates),
             'description': getattr(circuit, 'description', '')
         })
-    return jsonify({'circuits': circuit_list})
+    return _json({'circuits': circuit_list})
 
 # ============ SIMULATION API ============
 
@@ -158,7 +249,7 @@ def simulate_circuit(circuit_id: str):
     """
     try:
         if circuit_id not in circuits:
-            return jsonify({'error': 'Circuit not found'}), 404
+            return _json({'error': 'Circuit not found'}, 404)
             
         data = request.get_json() or {}
         shots = data.get('shots', 1024)
@@ -174,16 +265,29 @@ def simulate_circuit(circuit_id: str):
             noise_func = getattr(noise_mod, noise_model, None)
             if noise_func:
                 p = noise_params.get('p', 0.05)
+                # One call per gate: the channels are vectorized over both
+                # the state and the gate's full target list.
                 def noise_hook(state, gate):
-                    for target in getattr(gate, 'targets', []):
-                        state = noise_func(state, p, target)
-                    return state
+                    return noise_func(state, p, getattr(gate, 'targets', ()))
         
         simulator = StatevectorSimulator(circuit, noise_hook=noise_hook)
+
+        # Async mode: hand the run to the background executor and return a
+        # job id immediately instead of blocking the request thread.
+        if data.get('async'):
+            job_id = f"{circuit_id}_job_{next(_result_seq)}"
+            _sim_jobs[job_id] = _sim_exec().submit(simulator.run, shots=shots)
+            return _json({
+                'success': True,
+                'job_id': job_id,
+                'status': 'queued',
+                'poll': f'/api/v1/simulate/job/{job_id}'
+            }, 202)
+
         result = simulator.run(shots=shots)
         
         # Store result for later retrieval
-        result_id = f"{circuit_id}_sim_{len(simulation_results)}"
+        result_id = f"{circuit_id}_sim_{next(_result_seq)}"
         simulation_results[result_id] = {
             'circuit_id': circuit_id,
             'result': result,
@@ -202,25 +306,80 @@ def simulate_circuit(circuit_id: str):
                 'total_shots': sum(result.values()),
                 'unique_states': len(result)
             }
+        elif request.args.get('format') == 'binary' or output_format == 'binary':
+            # Raw little-endian buffer: 8-byte dimension header, then the
+            # complex64 amplitudes, then the float32 probabilities. Roughly
+            # 8x fewer bytes than the JSON float lists and no per-element
+            # Python object materialization.
+            amps = np.ascontiguousarray(np.asarray(result), dtype=np.complex64)
+            probs = amps.real * amps.real + amps.imag * amps.imag
+            buf = (
+                len(result).to_bytes(8, 'little')
+                + amps.tobytes()
+                + probs.tobytes()
+            )
+            return Response(
+                buf,
+                mimetype='application/octet-stream',
+                headers={'X-Result-Id': result_id, 'X-Dim': str(len(result))}
+            )
         else:
-            # Statevector
+            # Statevector. Fuse |z|^2 as re*re + im*im (np.abs squares,
+            # square-roots, and **2 squares again), and serialize amplitudes
+            # as interleaved [re, im] float64 pairs -- raw complex values are
+            # not JSON-serializable in the first place.
+            amps = np.ascontiguousarray(np.asarray(result), dtype=np.complex128)
+            probs = amps.real * amps.real + amps.imag * amps.imag
             response_data = {
                 'result_id': result_id,
                 'type': 'statevector',
                 'data': {
-                    'amplitudes': result.tolist() if hasattr(result, 'tolist') else list(result),
-                    'probabilities': (np.abs(result)**2).tolist() if hasattr(result, 'tolist') else list(np.abs(result)**2)
+                    'amplitudes': amps.view(np.float64).tolist(),
+                    'probabilities': probs.tolist()
                 },
                 'dimension': len(result)
             }
             
-        return jsonify({
+        return _json({
             'success': True,
             'simulation': response_data
         })
         
     except Exception as e:
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _json({'error': str(e), 'traceback': traceback.format_exc()}, 500)
+
+@app.route('/api/v1/simulate/job/<job_id>', methods=['GET'])
+def get_simulation_job(job_id: str):
+    """Poll an async simulation started with {"async": true}."""
+    future = _sim_jobs.get(job_id)
+    if future is None:
+        return _json({'error': 'Job not found'}, 404)
+    if not future.done():
+        return _json({'job_id': job_id, 'status': 'running'})
+    try:
+        result = future.result()
+    except Exception as e:
+        return _json({'job_id': job_id, 'status': 'failed', 'error': str(e)}, 500)
+
+    if isinstance(result, dict):
+        payload = {
+            'type': 'counts',
+            'data': result,
+            'total_shots': sum(result.values()),
+            'unique_states': len(result)
+        }
+    else:
+        amps = np.ascontiguousarray(np.asarray(result), dtype=np.complex128)
+        probs = amps.real * amps.real + amps.imag * amps.imag
+        payload = {
+            'type': 'statevector',
+            'data': {
+                'amplitudes': amps.view(np.float64).tolist(),
+                'probabilities': probs.tolist()
+            },
+            'dimension': len(result)
+        }
+    return _json({'job_id': job_id, 'status': 'completed', 'result': payload})
 
 @app.route('/api/v1/simulate/<circuit_id>/batch', methods=['POST'])
 def batch_simulate(circuit_id: str):
@@ -237,63 +396,116 @@ def batch_simulate(circuit_id: str):
     """
     try:
         if circuit_id not in circuits:
-            return jsonify({'error': 'Circuit not found'}), 404
+            return _json({'error': 'Circuit not found'}, 404)
             
         data = request.get_json()
         simulations = data.get('simulations', [])
         
+        # The sweep is embarrassingly parallel: fan the simulations out over
+        # a process pool so response latency tracks the slowest run, not the
+        # sum of all of them.
+        circuit = circuits[circuit_id]
+        gate_spec = [(g.name, tuple(g.targets), tuple(g.params)) for g in circuit.gates]
+        futures = [
+            _sim_pool().submit(_run_one, circuit.num_qubits, gate_spec, sim_config)
+            for sim_config in simulations
+        ]
+
         results = []
-        for i, sim_config in enumerate(simulations):
-            # Use the single simulation endpoint logic
-            request_data = json.dumps(sim_config)
-            # This is a simplified version - in production you'd properly call the simulation
-            circuit = circuits[circuit_id]
-            simulator = StatevectorSimulator(circuit)
-            result = simulator.run(shots=sim_config.get('shots', 1024))
-            
-            results.append({
-                'simulation_index': i,
-                'config': sim_config,
-                'result': result.tolist() if hasattr(result, 'tolist') else result
-            })
-            
-        return jsonify({
+        for i, (sim_config, future) in enumerate(zip(simulations, futures)):
+            result = future.result()
+            entry = {'simulation_index': i, 'config': sim_config}
+            if isinstance(result, dict):
+                entry['result'] = result
+            else:
+                # Base64-encoded complex64 buffer instead of a JSON float
+                # list: ~4x fewer bytes and no per-amplitude Python objects.
+                amps = np.ascontiguousarray(np.asarray(result), dtype=np.complex64)
+                entry['result'] = base64.b64encode(amps.tobytes()).decode('ascii')
+                entry['dtype'] = 'complex64'
+                entry['dim'] = len(result)
+            results.append(entry)
+
+        return _json({
             'success': True,
             'batch_results': results
         })
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return _json({'error': str(e)}, 500)
 
 # ============ HARDWARE INTEGRATION API ============
 
+# The provider manifest never changes per-process, so serialize it once at
+# import and serve the cached bytes; this endpoint backs polled UI dropdowns.
+_HARDWARE_PROVIDERS = [
+    {
+        'name': 'IBM Quantum',
+        'status': 'available',
+        'backends': ['ibm_brisbane', 'ibm_kyoto', 'simulator_mps'],
+        'max_qubits': 127,
+        'supports_pulse': True
+    },
+    {
+        'name': 'Google Quantum',
+        'status': 'mock',
+        'backends': ['sycamore', 'bristlecone'],
+        'max_qubits': 70,
+        'supports_pulse': False
+    },
+    {
+        'name': 'Rigetti',
+        'status': 'mock',
+        'backends': ['aspen-m-3', 'qvm-simulator'],
+        'max_qubits': 80,
+        'supports_pulse': True
+    }
+]
+_PROVIDERS_BODY = (
+    orjson.dumps({'providers': _HARDWARE_PROVIDERS})
+    if orjson is not None
+    else json.dumps({'providers': _HARDWARE_PROVIDERS}).encode('utf-8')
+)
+
+# Static mock payloads for the hardware job endpoints; only job_id varies.
+_JOB_STATUS_TEMPLATE = {
+    'status': 'completed',
+    'progress': 100,
+    'queue_position': 0,
+    'start_time': '2025-09-05T14:45:00Z',
+    'completion_time': '2025-09-05T14:47:30Z',
+    'hardware_info': {
+        'backend': 'ibm_brisbane',
+        'calibration_date': '2025-09-05T08:00:00Z',
+        'error_rates': {'cx': 0.012, 'readout': 0.025}
+    }
+}
+
+_MOCK_COUNTS = {
+    '00': 512,
+    '01': 234,
+    '10': 189,
+    '11': 89
+}
+_JOB_RESULT_TEMPLATE = {
+    'status': 'completed',
+    'result': {
+        'counts': _MOCK_COUNTS,
+        'shots': sum(_MOCK_COUNTS.values()),
+        'execution_time': 2.5,
+        'hardware_metadata': {
+            'backend': 'ibm_brisbane',
+            'gate_errors': {'cx_0_1': 0.013, 'readout_0': 0.022},
+            'temperature': 0.015
+        }
+    }
+}
+
+
 @app.route('/api/v1/hardware/providers', methods=['GET'])
 def list_hardware_providers():
     """List available quantum hardware providers."""
-    providers = [
-        {
-            'name': 'IBM Quantum',
-            'status': 'available',
-            'backends': ['ibm_brisbane', 'ibm_kyoto', 'simulator_mps'],
-            'max_qubits': 127,
-            'supports_pulse': True
-        },
-        {
-            'name': 'Google Quantum',
-            'status': 'mock',
-            'backends': ['sycamore', 'bristlecone'],
-            'max_qubits': 70,
-            'supports_pulse': False
-        },
-        {
-            'name': 'Rigetti',
-            'status': 'mock',
-            'backends': ['aspen-m-3', 'qvm-simulator'],
-            'max_qubits': 80,
-            'supports_pulse': True
-        }
-    ]
-    return jsonify({'providers': providers})
+    return Response(_PROVIDERS_BODY, mimetype='application/json')
 
 @app.route('/api/v1/hardware/submit/<circuit_id>', methods=['POST'])
 def submit_to_hardware(circuit_id: str):
@@ -309,7 +521,7 @@ def submit_to_hardware(circuit_id: str):
     """
     try:
         if circuit_id not in circuits:
-            return jsonify({'error': 'Circuit not found'}), 404
+            return _json({'error': 'Circuit not found'}, 404)
             
         data = request.get_json()
         provider = data.get('provider', 'IBM Quantum')
@@ -323,7 +535,7 @@ def submit_to_hardware(circuit_id: str):
         # In a real implementation, this would submit to actual hardware
         # For now, we'll simulate the job and return a mock response
         
-        return jsonify({
+        return _json({
             'success': True,
             'job_id': job_id,
             'provider': provider,
@@ -335,51 +547,74 @@ def submit_to_hardware(circuit_id: str):
         })
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return _json({'error': str(e)}, 500)
 
 @app.route('/api/v1/hardware/job/<job_id>/status', methods=['GET'])
 def get_job_status(job_id: str):
     """Get the status of a hardware job."""
     # Mock job status response
-    return jsonify({
-        'job_id': job_id,
-        'status': 'completed',
-        'progress': 100,
-        'queue_position': 0,
-        'start_time': '2025-09-05T14:45:00Z',
-        'completion_time': '2025-09-05T14:47:30Z',
-        'hardware_info': {
-            'backend': 'ibm_brisbane',
-            'calibration_date': '2025-09-05T08:00:00Z',
-            'error_rates': {'cx': 0.012, 'readout': 0.025}
-        }
-    })
+    return _json(dict(_JOB_STATUS_TEMPLATE, job_id=job_id))
 
 @app.route('/api/v1/hardware/job/<job_id>/result', methods=['GET'])
 def get_job_result(job_id: str):
     """Get the result of a completed hardware job."""
     # Mock hardware result
-    mock_counts = {
-        '00': 512,
-        '01': 234,
-        '10': 189,
-        '11': 89
+    return _json(dict(_JOB_RESULT_TEMPLATE, job_id=job_id))
+
+# Gate-walk summaries keyed by the circuit's mutation stamp. Every edit
+# (add_gate/clear) takes a fresh globally unique version, so a stale entry
+# can never be served -- unlike keying on (id, len), which confused a
+# cleared-and-refilled circuit (or a recycled id) with its predecessor.
+# The UI polls visualize/analyze, so repeated GETs between edits should
+# cost a dict lookup, not another walk over the gate list.
+_analysis_cache: Dict[int, Dict[str, Any]] = {}
+
+
+def _analyze(circuit: QuantumCircuit) -> Dict[str, Any]:
+    """Collect everything analyze/visualize need in one pass over the gates."""
+    version = getattr(circuit, '_version', None)
+    if version is not None:
+        cached = _analysis_cache.get(version)
+        if cached is not None:
+            return cached
+
+    gate_counts: Counter = Counter()
+    has_measurements = False
+    has_multi = False
+    max_arity = 0
+    gate_info_list = []
+    for i, gate in enumerate(circuit.gates):
+        gate_type = getattr(gate, 'gate_type', gate.name)
+        gate_counts[gate_type] += 1
+        arity = len(gate.targets)
+        if gate_type == 'M':
+            has_measurements = True
+        if arity > 1:
+            has_multi = True
+        if arity > max_arity:
+            max_arity = arity
+        gate_info_list.append({
+            'position': i,
+            'type': gate_type,
+            'targets': np.asarray(gate.targets).tolist(),
+            'controls': list(getattr(gate, 'controls', ())),
+            'params': np.asarray(getattr(gate, 'params', ())).tolist(),
+            'label': gate_type
+        })
+
+    payload = {
+        'gate_counts': dict(gate_counts),
+        'has_measurements': has_measurements,
+        'has_multi_qubit_gates': has_multi,
+        'max_gate_arity': max_arity,
+        'gates': gate_info_list
     }
-    
-    return jsonify({
-        'job_id': job_id,
-        'status': 'completed',
-        'result': {
-            'counts': mock_counts,
-            'shots': sum(mock_counts.values()),
-            'execution_time': 2.5,
-            'hardware_metadata': {
-                'backend': 'ibm_brisbane',
-                'gate_errors': {'cx_0_1': 0.013, 'readout_0': 0.022},
-                'temperature': 0.015
-            }
-        }
-    })
+    if version is not None:
+        if len(_analysis_cache) > 512:
+            _analysis_cache.clear()
+        _analysis_cache[version] = payload
+    return payload
+
 
 # ============ VISUALIZATION API ============
 
@@ -387,31 +622,18 @@ def get_job_result(job_id: str):
 def visualize_circuit(circuit_id: str):
     """Get circuit visualization data."""
     if circuit_id not in circuits:
-        return jsonify({'error': 'Circuit not found'}), 404
+        return _json({'error': 'Circuit not found'}, 404)
         
     circuit = circuits[circuit_id]
-    
-    # Create visualization data
-    viz_data = {
+    summary = _analyze(circuit)
+
+    return _json({
         'circuit_id': circuit_id,
         'num_qubits': circuit.num_qubits,
         'depth': len(circuit.gates),
-        'gates': [],
+        'gates': summary['gates'],
         'qubit_labels': [f'q{i}' for i in range(circuit.num_qubits)]
-    }
-    
-    for i, gate in enumerate(circuit.gates):
-        gate_info = {
-            'position': i,
-            'type': gate.gate_type,
-            'targets': gate.targets,
-            'controls': getattr(gate, 'controls', []),
-            'params': getattr(gate, 'params', []),
-            'label': gate.gate_type
-        }
-        viz_data['gates'].append(gate_info)
-    
-    return jsonify(viz_data)
+    })
 
 # ============ ANALYSIS API ============
 
@@ -419,41 +641,35 @@ def visualize_circuit(circuit_id: str):
 def analyze_circuit(circuit_id: str):
     """Analyze circuit properties and complexity."""
     if circuit_id not in circuits:
-        return jsonify({'error': 'Circuit not found'}), 404
+        return _json({'error': 'Circuit not found'}, 404)
         
     circuit = circuits[circuit_id]
-    
-    # Count gate types
-    gate_counts = {}
-    for gate in circuit.gates:
-        gate_type = gate.gate_type
-        gate_counts[gate_type] = gate_counts.get(gate_type, 0) + 1
-    
-    # Calculate circuit metrics
+    summary = _analyze(circuit)
+
     analysis = {
         'circuit_id': circuit_id,
         'metrics': {
             'depth': len(circuit.gates),
             'width': circuit.num_qubits,
             'gate_count': len(circuit.gates),
-            'gate_types': gate_counts,
+            'gate_types': summary['gate_counts'],
             'complexity_score': len(circuit.gates) * circuit.num_qubits
         },
         'properties': {
-            'has_measurements': any(gate.gate_type == 'M' for gate in circuit.gates),
-            'has_multi_qubit_gates': any(len(gate.targets) > 1 for gate in circuit.gates),
-            'max_gate_arity': max((len(gate.targets) for gate in circuit.gates), default=0)
+            'has_measurements': summary['has_measurements'],
+            'has_multi_qubit_gates': summary['has_multi_qubit_gates'],
+            'max_gate_arity': summary['max_gate_arity']
         }
     }
-    
-    return jsonify(analysis)
+
+    return _json(analysis)
 
 # ============ UTILITY ENDPOINTS ============
 
 @app.route('/api/v1/health', methods=['GET'])
 def health_check():
     """API health check endpoint."""
-    return jsonify({
+    return _json({
         'status': 'healthy',
         'version': '1.0.0',
         'active_circuits': len(circuits),
@@ -466,17 +682,17 @@ def reset_all():
     global circuits, simulation_results
     circuits.clear()
     simulation_results.clear()
-    return jsonify({'success': True, 'message': 'All data cleared'})
+    return _json({'success': True, 'message': 'All data cleared'})
 
 # ============ ERROR HANDLERS ============
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({'error': 'Endpoint not found'}), 404
+    return _json({'error': 'Endpoint not found'}, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({'error': 'Internal server error'}), 500
+    return _json({'error': 'Internal server error'}, 500)
 
 def run_api_server(host='localhost', port=5000, debug=True):
     """Run the API server."""
@@ -492,7 +708,8 @@ def run_api_server(host='localhost', port=5000, debug=True):
     print("- GET /api/v1/analyze/<id> - Analyze circuit")
     print("- GET /api/v1/health - Health check")
     
-    app.run(host=host, port=port, debug=debug)
+    # threaded=True so one long simulation cannot block every other endpoint.
+    app.run(host=host, port=port, debug=debug, threaded=True)
 
 if __name__ == '__main__':
     run_api_server()
@@ -1,30 +1,159 @@
 
+import itertools
+
 import numpy as np
 from typing import List, Callable, Any, Union
 
+try:
+	import numba
+except ImportError:  # pragma: no cover - optional accelerator
+	numba = None
+
+# Integer opcodes for the jitted gate dispatch; measurement is not an
+# opcode -- simulate() returns the full statevector.
+_OPCODES = {'H': 0, 'X': 1, 'RX': 2, 'RY': 3, 'RZ': 4, 'CNOT': 5, 'SWAP': 6}
+
+# Globally unique per-mutation stamp: every circuit edit takes the next
+# value, so a version number can never be seen twice (not even across
+# id()-recycled circuit objects).
+_mutation_seq = itertools.count()
+
+
+def _apply_gates(state, opcodes, targets_flat, offsets, params, num_qubits):
+	"""Apply the SoA gate tables to state in place.
+
+	Written njit-compatible (scalar loops, no Python objects) so numba can
+	compile it to machine code when installed; the pure-Python fallback
+	runs the same logic.
+	"""
+	for g in range(len(opcodes)):
+		op = opcodes[g]
+		start = offsets[g]
+		if op == 5:  # CNOT
+			cbit = 1 << targets_flat[start]
+			tbit = 1 << targets_flat[start + 1]
+			for i in range(len(state)):
+				if (i & cbit) != 0 and (i & tbit) == 0:
+					j = i | tbit
+					tmp = state[i]
+					state[i] = state[j]
+					state[j] = tmp
+		elif op == 6:  # SWAP
+			abit = 1 << targets_flat[start]
+			bbit = 1 << targets_flat[start + 1]
+			for i in range(len(state)):
+				if (i & abit) != 0 and (i & bbit) == 0:
+					j = (i ^ abit) | bbit
+					tmp = state[i]
+					state[i] = state[j]
+					state[j] = tmp
+		else:
+			theta = params[g]
+			if op == 0:  # H
+				inv = 1.0 / np.sqrt(2.0)
+				u00 = inv + 0j
+				u01 = inv + 0j
+				u10 = inv + 0j
+				u11 = -inv + 0j
+			elif op == 1:  # X
+				u00 = 0j
+				u01 = 1 + 0j
+				u10 = 1 + 0j
+				u11 = 0j
+			elif op == 2:  # RX
+				c = np.cos(theta / 2)
+				s = np.sin(theta / 2)
+				u00 = c + 0j
+				u01 = -1j * s
+				u10 = -1j * s
+				u11 = c + 0j
+			elif op == 3:  # RY
+				c = np.cos(theta / 2)
+				s = np.sin(theta / 2)
+				u00 = c + 0j
+				u01 = -s + 0j
+				u10 = s + 0j
+				u11 = c + 0j
+			else:  # RZ
+				u00 = np.exp(-0.5j * theta)
+				u01 = 0j
+				u10 = 0j
+				u11 = np.exp(0.5j * theta)
+			bit = 1 << targets_flat[start]
+			for i in range(len(state)):
+				if (i & bit) == 0:
+					j = i | bit
+					a = state[i]
+					b = state[j]
+					state[i] = u00 * a + u01 * b
+					state[j] = u10 * a + u11 * b
+	return state
+
+
+if numba is not None:
+	_apply_gates = numba.njit(cache=True)(_apply_gates)
+
+
 class Gate:
-	"""Base class for quantum gates."""
+	"""Base class for quantum gates.
+
+	Slotted, with typed target/param arrays: no per-instance __dict__ and
+	no boxed Python ints/floats, so large circuits stay compact and the
+	arrays feed NumPy/numba passes zero-copy.
+	"""
+	__slots__ = ('name', 'targets', 'params')
+
 	def __init__(self, name: str, targets: List[int], params: List[Any] = None):
 		self.name = name
-		self.targets = list(targets)
-		self.params = params or []
+		self.targets = np.asarray(targets, dtype=np.int32)
+		self.params = np.asarray(params if params is not None else (), dtype=np.float64)
 
 	def __repr__(self):
-		return f"Gate({self.name}, targets={self.targets}, params={self.params})"
+		return f"Gate({self.name}, targets={self.targets.tolist()}, params={self.params.tolist()})"
 
 
 
 class QuantumCircuit:
-	"""Simple quantum circuit class."""
+	"""Simple quantum circuit class.
+
+	Gates live in a struct-of-arrays layout -- parallel lists of names,
+	int32 target arrays and float64 param arrays -- so vectorized passes
+	(draw, simulators) can walk contiguous data without per-gate attribute
+	chasing. The `gates` property materializes Gate views lazily for code
+	that wants objects.
+	"""
 	def __init__(self, num_qubits: int):
 		self.num_qubits = int(num_qubits)
-		self.gates: List[Gate] = []
+		self._names: List[str] = []
+		self._targets: List[np.ndarray] = []
+		self._params: List[np.ndarray] = []
+		self._gate_view: List[Gate] = None
+		self._version = next(_mutation_seq)
 		self.registers = {}
 
+	@property
+	def gates(self) -> List[Gate]:
+		"""Gate views over the parallel arrays, rebuilt after mutation."""
+		if self._gate_view is None:
+			self._gate_view = [
+				Gate(name, targets, params)
+				for name, targets, params in zip(self._names, self._targets, self._params)
+			]
+		return self._gate_view
+
 	def add_register(self, name: str, size: int):
 		"""Add a named register (convenience)."""
 		self.registers[name] = int(size)
 
+	def _append(self, name: str, targets, params):
+		self._names.append(str(name))
+		self._targets.append(np.asarray(targets, dtype=np.int32))
+		self._params.append(
+			np.asarray(params if params is not None else (), dtype=np.float64)
+		)
+		self._gate_view = None
+		self._version = next(_mutation_seq)
+
 	def add_gate(self, gate: Union[Gate, str], targets: List[int] = None, params: List[Any] = None):
 		"""Add a Gate instance or provide name/targets/params.
 
@@ -33,27 +162,76 @@ class QuantumCircuit:
 			add_gate('H', targets=[0])
 		"""
 		if isinstance(gate, Gate):
-			self.gates.append(gate)
+			self._append(gate.name, gate.targets, gate.params)
 			return
 		if isinstance(gate, str):
 			if targets is None:
 				raise ValueError('targets required when adding gate by name')
-			self.gates.append(Gate(gate, targets, params))
+			self._append(gate, targets, params)
 			return
 		# fallback
 		raise TypeError('gate must be Gate or str')
 
+	def clear(self):
+		"""Remove all gates."""
+		self._names.clear()
+		self._targets.clear()
+		self._params.clear()
+		self._gate_view = None
+		self._version = next(_mutation_seq)
+
+	def simulate(self, state: np.ndarray = None) -> np.ndarray:
+		"""Apply the circuit to a statevector via the SoA kernel.
+
+		Measurement gates are skipped (use StatevectorSimulator for shot
+		sampling). Starts from |0...0> when no state is given and returns
+		the final statevector.
+		"""
+		if state is None:
+			state = np.zeros(2 ** self.num_qubits, dtype=np.complex128)
+			state[0] = 1.0
+		else:
+			state = np.array(state, dtype=np.complex128)
+		opcode_list = []
+		target_list = []
+		param_list = []
+		for name, targets, params in zip(self._names, self._targets, self._params):
+			if name in ('M', 'Measure'):
+				continue
+			if name not in _OPCODES:
+				raise ValueError(f'Unsupported gate for simulate: {name}')
+			opcode_list.append(_OPCODES[name])
+			target_list.append(targets)
+			param_list.append(params[0] if len(params) else 0.0)
+		if not opcode_list:
+			return state
+		opcodes = np.asarray(opcode_list, dtype=np.int64)
+		lengths = np.array([len(t) for t in target_list], dtype=np.int64)
+		offsets = np.cumsum(lengths) - lengths
+		targets_flat = np.concatenate(target_list).astype(np.int64)
+		flat_params = np.asarray(param_list, dtype=np.float64)
+		return _apply_gates(state, opcodes, targets_flat, offsets, flat_params, self.num_qubits)
+
 	def draw(self):
-		# Simple ASCII circuit diagram
-		lines = [f"q[{i}]: " for i in range(self.num_qubits)]
-		for gate in self.gates:
+		# Simple ASCII circuit diagram, rendered through a NumPy char grid:
+		# one broadcast fill for the wires, one fancy-indexed scatter per
+		# column, instead of a Python string append per qubit x gate cell.
+		if not self._names:
 			for i in range(self.num_qubits):
-				if i in gate.targets:
-					lines[i] += f"--{gate.name}--"
-				else:
-					lines[i] += "-------"
-		for l in lines:
-			print(l)
+				print(f"q[{i}]: ")
+			return
+		# Format every gate label in one vectorized pass and size the cells
+		# to the longest label (itemsize is 4 bytes per character for 'U'
+		# dtypes), so no gate name is ever truncated.
+		names = np.asarray(self._names)
+		labels = np.char.add(np.char.add('--', names), '--')
+		cell_width = max(7, labels.dtype.itemsize // 4)
+		grid = np.full((self.num_qubits, len(names)), '-------', dtype=f'U{cell_width}')
+		for j, targets in enumerate(self._targets):
+			in_range = targets[(targets >= 0) & (targets < self.num_qubits)]
+			grid[in_range, j] = labels[j]
+		for i, row in enumerate(grid):
+			print(f"q[{i}]: " + ''.join(row))
 
 	def __repr__(self):
 		return f"QuantumCircuit(num_qubits={self.num_qubits}, gates={self.gates})"
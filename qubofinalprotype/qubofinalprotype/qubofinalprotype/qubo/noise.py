@@ -1,65 +1,82 @@
 
 import numpy as np
 
+
+def _as_targets(target):
+	"""Normalize a single qubit index or a sequence of indices to a 1-D array."""
+	return np.atleast_1d(np.asarray(target, dtype=np.intp))
+
+
 def bit_flip(state, p, target):
-	"""Bit-flip noise channel on target qubit with probability p."""
-	n = int(np.log2(len(state)))
-	new_state = state.copy()
-	for i in range(len(state)):
-		if np.random.rand() < p:
-			j = i ^ (1 << target)
-			new_state[i], new_state[j] = new_state[j], new_state[i]
-	return new_state
+	"""Bit-flip noise channel on the target qubit(s) with probability p."""
+	state = np.asarray(state)
+	idx = np.arange(len(state))
+	for t in _as_targets(target):
+		partner = idx ^ (1 << int(t))
+		# Draw one random number per amplitude pair (keyed by the lower
+		# index) so the swap mask is symmetric and stays a permutation.
+		r = np.random.rand(len(state))
+		mask = r[np.minimum(idx, partner)] < p
+		state = np.where(mask, state[partner], state)
+	return state
+
 
 def phase_flip(state, p, target):
-	"""Phase-flip noise channel on target qubit with probability p."""
-	n = int(np.log2(len(state)))
-	new_state = state.copy()
-	for i in range(len(state)):
-		if ((i >> target) & 1) and np.random.rand() < p:
-			new_state[i] *= -1
-	return new_state
+	"""Phase-flip noise channel on the target qubit(s) with probability p."""
+	state = np.asarray(state)
+	idx = np.arange(len(state))
+	for t in _as_targets(target):
+		mask = (((idx >> int(t)) & 1) == 1) & (np.random.rand(len(state)) < p)
+		state = np.where(mask, -state, state)
+	return state
+
 
 def depolarizing(state, p, target):
-	"""Depolarizing noise channel on target qubit with probability p."""
-	if np.random.rand() < p:
-		# Randomly apply X, Y, or Z
-		op = np.random.choice(['X', 'Y', 'Z'])
-		if op == 'X':
-			return bit_flip(state, 1.0, target)
-		elif op == 'Y':
-			# Y = iXZ
-			s = bit_flip(state, 1.0, target)
-			s = phase_flip(s, 1.0, target)
-			return 1j * s
-		elif op == 'Z':
-			return phase_flip(state, 1.0, target)
+	"""Depolarizing noise channel on the target qubit(s) with probability p."""
+	for t in _as_targets(target):
+		if np.random.rand() < p:
+			# Randomly apply X, Y, or Z
+			op = np.random.choice(['X', 'Y', 'Z'])
+			if op == 'X':
+				state = bit_flip(state, 1.0, t)
+			elif op == 'Y':
+				# Y = iXZ
+				s = bit_flip(state, 1.0, t)
+				s = phase_flip(s, 1.0, t)
+				state = 1j * s
+			elif op == 'Z':
+				state = phase_flip(state, 1.0, t)
 	return state
 
+
 def amplitude_damping(state, p, target):
 	"""Amplitude damping channel (simplified, not full Kraus)."""
-	n = int(np.log2(len(state)))
-	new_state = state.copy()
-	for i in range(len(state)):
-		if ((i >> target) & 1) and np.random.rand() < p:
-			j = i & ~(1 << target)
-			new_state[j] += new_state[i]
-			new_state[i] = 0
-	return new_state
+	state = np.asarray(state)
+	idx = np.arange(len(state))
+	for t in _as_targets(target):
+		bit = 1 << int(t)
+		excited = idx[(idx & bit) != 0]
+		damped = excited[np.random.rand(len(excited)) < p]
+		if len(damped):
+			new_state = state.copy()
+			new_state[damped ^ bit] += state[damped]
+			new_state[damped] = 0
+			state = new_state
+	return state
 
 
 def make_noise_hook(channels: dict):
 	"""Return a noise_hook(state, gate) which applies channels when gate.targets mention a qubit.
 
-	channels: mapping from gate name or 'global' to a tuple (func, p) where func(state,p,target) -> state
+	channels: mapping from gate name or 'global' to a tuple (func, p) where
+	func(state, p, targets) -> state and targets may be an int or a sequence.
 	Example: {'bitflip': (bit_flip, 0.01)}
 	"""
 
 	def hook(state, gate):
-		# apply all channel functions listed in channels to gate.targets
+		# each channel is vectorized over the state and the full target list
 		for name, (func, p) in channels.items():
-			for t in gate.targets:
-				state = func(state, p, t)
+			state = func(state, p, gate.targets)
 		return state
 
 	return hook
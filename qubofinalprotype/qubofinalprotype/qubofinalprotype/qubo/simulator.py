@@ -19,8 +19,12 @@ class StatevectorSimulator:
 
 	def _apply_single_qubit_unitary(self, state: np.ndarray, U: np.ndarray, target: int) -> np.ndarray:
 		n = self.num_qubits
+		# Little-endian: bit `target` of the amplitude index addresses the
+		# qubit (axis n-1-target of the tensor), matching _apply_cnot/
+		# _apply_swap and QuantumCircuit.simulate.
+		axis = n - 1 - target
 		tensor = state.reshape([2] * n)
-		axes = [target] + [i for i in range(n) if i != target]
+		axes = [axis] + [i for i in range(n) if i != axis]
 		t = np.transpose(tensor, axes)
 		t = t.reshape(2, -1)
 		t = U @ t
@@ -63,15 +67,15 @@ class StatevectorSimulator:
 				X = np.array([[0, 1], [1, 0]], dtype=complex)
 				state = self._apply_single_qubit_unitary(state, X, gate.targets[0])
 			elif name == 'RX':
-				theta = gate.params[0] if gate.params else 0.0
+				theta = gate.params[0] if len(gate.params) else 0.0
 				RX = np.array([[np.cos(theta / 2), -1j * np.sin(theta / 2)], [-1j * np.sin(theta / 2), np.cos(theta / 2)]], dtype=complex)
 				state = self._apply_single_qubit_unitary(state, RX, gate.targets[0])
 			elif name == 'RY':
-				theta = gate.params[0] if gate.params else 0.0
+				theta = gate.params[0] if len(gate.params) else 0.0
 				RY = np.array([[np.cos(theta / 2), -np.sin(theta / 2)], [np.sin(theta / 2), np.cos(theta / 2)]], dtype=complex)
 				state = self._apply_single_qubit_unitary(state, RY, gate.targets[0])
 			elif name == 'RZ':
-				theta = gate.params[0] if gate.params else 0.0
+				theta = gate.params[0] if len(gate.params) else 0.0
 				RZ = np.array([[np.exp(-0.5j * theta), 0], [0, np.exp(0.5j * theta)]], dtype=complex)
 				state = self._apply_single_qubit_unitary(state, RZ, gate.targets[0])
 			elif name == 'CNOT':
@@ -12,3 +12,18 @@ def test_h_on_zero():
 	probs = np.abs(state) ** 2
 	assert pytest.approx(probs.sum(), rel=1e-6) == 1.0
 
+
+
+def test_simulate_matches_statevector_simulator():
+	# Both simulation paths must share the little-endian bit convention.
+	qc = QuantumCircuit(3)
+	qc.add_gate('H', targets=[0])
+	qc.add_gate('X', targets=[2])
+	qc.add_gate('RX', targets=[1], params=[0.7])
+	qc.add_gate('RY', targets=[0], params=[1.1])
+	qc.add_gate('RZ', targets=[2], params=[0.3])
+	qc.add_gate('CNOT', targets=[0, 1])
+	qc.add_gate('SWAP', targets=[1, 2])
+	sim_state = StatevectorSimulator(qc).run()
+	kernel_state = qc.simulate()
+	assert np.allclose(sim_state, kernel_state)